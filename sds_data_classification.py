@@ -1,31 +1,52 @@
 import enum
 import datetime
+import time
 from dataclasses import dataclass
 from typing import List
 
-# Enum definitions for classification categories
-class UsageFrequency(enum.Enum):
-    HIGH = "High"
-    MEDIUM = "Medium"
-    LOW = "Low"
+import numpy as np
 
-class ArtifactType(enum.Enum):
-    PHOTOGRAPH = "Photograph"
-    DOCUMENT = "Document"
-    VIDEO = "Video"
+# Enum definitions for classification categories. Members are small integer
+# codes so they can index NumPy arrays directly; display strings live in _LABELS.
+class LabeledIntEnum(enum.IntEnum):
+    @property
+    def label(self) -> str:
+        """Human-readable name of this member."""
+        return _LABELS[type(self)][self]
 
-class Importance(enum.Enum):
-    CRITICAL = "Critical"
-    STANDARD = "Standard"
-    LOW = "Low"
+class UsageFrequency(LabeledIntEnum):
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
 
-class StorageTier(enum.Enum):
-    HOT = "Hot Storage"
-    WARM = "Warm Storage"
-    COLD = "Cold Storage"
+class ArtifactType(LabeledIntEnum):
+    PHOTOGRAPH = 0
+    DOCUMENT = 1
+    VIDEO = 2
+
+class Importance(LabeledIntEnum):
+    CRITICAL = 0
+    STANDARD = 1
+    LOW = 2
+
+class StorageTier(LabeledIntEnum):
+    HOT = 0
+    WARM = 1
+    COLD = 2
+
+_LABELS = {
+    UsageFrequency: ("High", "Medium", "Low"),
+    ArtifactType: ("Photograph", "Document", "Video"),
+    Importance: ("Critical", "Standard", "Low"),
+    StorageTier: ("Hot Storage", "Warm Storage", "Cold Storage")
+}
+
+# Code -> member lookups for the vectorized paths
+USAGE_LEVELS = list(UsageFrequency)
+TIERS = list(StorageTier)
 
 # Data class to represent an artifact
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     id: str
     name: str
@@ -34,9 +55,9 @@ class Artifact:
     last_accessed: datetime.datetime
     importance: Importance
 
-    def get_usage_frequency(self) -> UsageFrequency:
+    def get_usage_frequency(self, now_ts: float) -> UsageFrequency:
         """Determine usage frequency based on access count in the last 30 days."""
-        days_since_access = (datetime.datetime.now() - self.last_accessed).days
+        days_since_access = int((now_ts - self.last_accessed.timestamp()) // 86400)
         if days_since_access > 30:
             return UsageFrequency.LOW
         accesses_per_month = self.access_count
@@ -46,32 +67,84 @@ class Artifact:
             return UsageFrequency.MEDIUM
         return UsageFrequency.LOW
 
+# Structure-of-arrays view of a set of artifacts, used by the vectorized classifier
+@dataclass
+class ArtifactBatch:
+    type: np.ndarray  # int8 index into ArtifactType
+    access_count: np.ndarray  # int32
+    last_accessed: np.ndarray  # float64 Unix timestamp
+    importance: np.ndarray  # int8 index into Importance
+
+    @classmethod
+    def from_artifacts(cls, artifacts: List[Artifact]) -> "ArtifactBatch":
+        """Pack a list of artifacts into parallel arrays."""
+        n = len(artifacts)
+        return cls(
+            type=np.fromiter((a.type for a in artifacts), dtype=np.int8, count=n),
+            access_count=np.fromiter((a.access_count for a in artifacts), dtype=np.int32, count=n),
+            last_accessed=np.fromiter((a.last_accessed.timestamp() for a in artifacts), dtype=np.float64, count=n),
+            importance=np.fromiter((a.importance for a in artifacts), dtype=np.int8, count=n)
+        )
+
+# Storage tier for every (importance, usage frequency) combination
+_TIER_TABLE = {
+    (Importance.CRITICAL, UsageFrequency.HIGH): StorageTier.HOT,
+    (Importance.CRITICAL, UsageFrequency.MEDIUM): StorageTier.HOT,
+    (Importance.CRITICAL, UsageFrequency.LOW): StorageTier.HOT,
+    (Importance.STANDARD, UsageFrequency.HIGH): StorageTier.HOT,
+    (Importance.STANDARD, UsageFrequency.MEDIUM): StorageTier.WARM,
+    (Importance.STANDARD, UsageFrequency.LOW): StorageTier.WARM,
+    (Importance.LOW, UsageFrequency.HIGH): StorageTier.HOT,
+    (Importance.LOW, UsageFrequency.MEDIUM): StorageTier.WARM,
+    (Importance.LOW, UsageFrequency.LOW): StorageTier.COLD,
+}
+# Same table as tier codes, indexed by [importance code, usage code]
+_TIER_CODES = np.array([[0, 0, 0], [0, 1, 1], [0, 1, 2]], dtype=np.int8)
+
 # Classification and storage assignment logic
 class SDSClassifier:
-    def classify_and_assign(self, artifact: Artifact) -> StorageTier:
-        """Classify artifact and assign it to a storage tier."""
-        usage = artifact.get_usage_frequency()
-        
-        # Classification rules for storage tier assignment
-        if artifact.importance == Importance.CRITICAL or usage == UsageFrequency.HIGH:
-            return StorageTier.HOT
-        elif usage == UsageFrequency.MEDIUM or artifact.importance == Importance.STANDARD:
-            return StorageTier.WARM
-        else:
-            return StorageTier.COLD
+    @staticmethod
+    def classify_and_assign(artifact: Artifact, usage: UsageFrequency) -> StorageTier:
+        """Classify artifact, given its precomputed usage frequency, and assign it to a storage tier."""
+        return _TIER_TABLE[(artifact.importance, usage)]
+
+    @staticmethod
+    def usage_batch(access_count: np.ndarray, last_accessed: np.ndarray, now_ts: float) -> np.ndarray:
+        """Vectorized get_usage_frequency; returns indices into UsageFrequency."""
+        # Whole days, matching get_usage_frequency
+        days = (now_ts - last_accessed) // 86400.0
+        recent = days <= 30
+        usage_high = (access_count > 10) & recent
+        usage_med = (access_count >= 1) & recent & ~usage_high
+        return np.where(usage_high, 0, np.where(usage_med, 1, 2)).astype(np.int8)
+
+    @staticmethod
+    def classify_batch(access_count: np.ndarray, last_accessed: np.ndarray,
+                       importance: np.ndarray, now_ts: float) -> np.ndarray:
+        """Vectorized classify_and_assign; returns indices into StorageTier."""
+        usage = SDSClassifier.usage_batch(access_count, last_accessed, now_ts)
+        return SDSClassifier.assign_batch(importance, usage)
+
+    @staticmethod
+    def assign_batch(importance: np.ndarray, usage: np.ndarray) -> np.ndarray:
+        """Look up tier codes for precomputed importance and usage codes."""
+        return _TIER_CODES[importance, usage]
 
     def process_artifacts(self, artifacts: List[Artifact]) -> List[dict]:
         """Process a list of artifacts and return classification results."""
+        batch = ArtifactBatch.from_artifacts(artifacts)
+        now_ts = time.time()
+        usage = self.usage_batch(batch.access_count, batch.last_accessed, now_ts)
+        tiers = self.assign_batch(batch.importance, usage)
         results = []
-        for artifact in artifacts:
-            tier = self.classify_and_assign(artifact)
+        for artifact, usage_code, tier_code in zip(artifacts, usage.tolist(), tiers.tolist()):
             results.append({
                 "id": artifact.id,
                 "name": artifact.name,
-                "type": artifact.type.value,
-                "usage_frequency": artifact.get_usage_frequency().value,
-                "importance": artifact.importance.value,
-                "assigned_tier": tier.value
+                "type": artifact.type.label,
+                "usage_frequency": USAGE_LEVELS[usage_code].label,
+                "importance": artifact.importance.label,
+                "assigned_tier": TIERS[tier_code].label
             })
         return results
 
@@ -4,31 +4,54 @@ import asyncio
 import time
 from dataclasses import dataclass
 from typing import List, Dict
-from statistics import mean, stdev
 
-# Enum definitions for classification categories
-class UsageFrequency(enum.Enum):
-    HIGH = "High"
-    MEDIUM = "Medium"
-    LOW = "Low"
+import numpy as np
 
-class ArtifactType(enum.Enum):
-    PHOTOGRAPH = "Photograph"
-    DOCUMENT = "Document"
-    VIDEO = "Video"
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows); use the stock event loop
+    uvloop = None
 
-class Importance(enum.Enum):
-    CRITICAL = "Critical"
-    STANDARD = "Standard"
-    LOW = "Low"
+# Enum definitions for classification categories. Members are small integer
+# codes so they can index NumPy arrays directly; display strings live in _LABELS.
+class LabeledIntEnum(enum.IntEnum):
+    @property
+    def label(self) -> str:
+        """Human-readable name of this member."""
+        return _LABELS[type(self)][self]
 
-class StorageTier(enum.Enum):
-    HOT = "Hot Storage"
-    WARM = "Warm Storage"
-    COLD = "Cold Storage"
+class UsageFrequency(LabeledIntEnum):
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+class ArtifactType(LabeledIntEnum):
+    PHOTOGRAPH = 0
+    DOCUMENT = 1
+    VIDEO = 2
+
+class Importance(LabeledIntEnum):
+    CRITICAL = 0
+    STANDARD = 1
+    LOW = 2
+
+class StorageTier(LabeledIntEnum):
+    HOT = 0
+    WARM = 1
+    COLD = 2
+
+_LABELS = {
+    UsageFrequency: ("High", "Medium", "Low"),
+    ArtifactType: ("Photograph", "Document", "Video"),
+    Importance: ("Critical", "Standard", "Low"),
+    StorageTier: ("Hot Storage", "Warm Storage", "Cold Storage")
+}
+
+# Code -> member lookups for the vectorized paths
+TIERS = list(StorageTier)
 
 # Data class to represent an artifact
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     id: str
     name: str
@@ -37,9 +60,9 @@ class Artifact:
     last_accessed: float  # Unix timestamp
     importance: Importance
 
-    def get_usage_frequency(self) -> UsageFrequency:
+    def get_usage_frequency(self, now_ts: float) -> UsageFrequency:
         """Determine usage frequency based on access count in the last 30 days."""
-        days_since_access = (time.time() - self.last_accessed) / (24 * 3600)
+        days_since_access = (now_ts - self.last_accessed) / (24 * 3600)
         if days_since_access > 30:
             return UsageFrequency.LOW
         accesses_per_month = self.access_count
@@ -49,17 +72,62 @@ class Artifact:
             return UsageFrequency.MEDIUM
         return UsageFrequency.LOW
 
+# Structure-of-arrays view of a set of artifacts, used by the vectorized classifier
+@dataclass
+class ArtifactBatch:
+    type: np.ndarray  # int8 index into ArtifactType
+    access_count: np.ndarray  # int32
+    last_accessed: np.ndarray  # float64 Unix timestamp
+    importance: np.ndarray  # int8 index into Importance
+
+    @classmethod
+    def from_artifacts(cls, artifacts: List[Artifact]) -> "ArtifactBatch":
+        """Pack a list of artifacts into parallel arrays."""
+        n = len(artifacts)
+        return cls(
+            type=np.fromiter((a.type for a in artifacts), dtype=np.int8, count=n),
+            access_count=np.fromiter((a.access_count for a in artifacts), dtype=np.int32, count=n),
+            last_accessed=np.fromiter((a.last_accessed for a in artifacts), dtype=np.float64, count=n),
+            importance=np.fromiter((a.importance for a in artifacts), dtype=np.int8, count=n)
+        )
+
+# Storage tier for every (importance, usage frequency) combination
+_TIER_TABLE = {
+    (Importance.CRITICAL, UsageFrequency.HIGH): StorageTier.HOT,
+    (Importance.CRITICAL, UsageFrequency.MEDIUM): StorageTier.HOT,
+    (Importance.CRITICAL, UsageFrequency.LOW): StorageTier.HOT,
+    (Importance.STANDARD, UsageFrequency.HIGH): StorageTier.HOT,
+    (Importance.STANDARD, UsageFrequency.MEDIUM): StorageTier.WARM,
+    (Importance.STANDARD, UsageFrequency.LOW): StorageTier.WARM,
+    (Importance.LOW, UsageFrequency.HIGH): StorageTier.HOT,
+    (Importance.LOW, UsageFrequency.MEDIUM): StorageTier.WARM,
+    (Importance.LOW, UsageFrequency.LOW): StorageTier.COLD,
+}
+# Same table as tier codes, indexed by [importance code, usage code]
+_TIER_CODES = np.array([[0, 0, 0], [0, 1, 1], [0, 1, 2]], dtype=np.int8)
+
 # Classification and storage assignment logic
 class SDSClassifier:
-    def classify_and_assign(self, artifact: Artifact) -> StorageTier:
-        """Classify artifact and assign it to a storage tier."""
-        usage = artifact.get_usage_frequency()
-        if artifact.importance == Importance.CRITICAL or usage == UsageFrequency.HIGH:
-            return StorageTier.HOT
-        elif usage == UsageFrequency.MEDIUM or artifact.importance == Importance.STANDARD:
-            return StorageTier.WARM
-        else:
-            return StorageTier.COLD
+    @staticmethod
+    def classify_and_assign(artifact: Artifact, usage: UsageFrequency) -> StorageTier:
+        """Classify artifact, given its precomputed usage frequency, and assign it to a storage tier."""
+        return _TIER_TABLE[(artifact.importance, usage)]
+
+    @staticmethod
+    def usage_batch(access_count: np.ndarray, last_accessed: np.ndarray, now_ts: float) -> np.ndarray:
+        """Vectorized get_usage_frequency; returns indices into UsageFrequency."""
+        days = (now_ts - last_accessed) * (1 / 86400.0)
+        recent = days <= 30
+        usage_high = (access_count > 10) & recent
+        usage_med = (access_count >= 1) & recent & ~usage_high
+        return np.where(usage_high, 0, np.where(usage_med, 1, 2)).astype(np.int8)
+
+    @staticmethod
+    def classify_batch(access_count: np.ndarray, last_accessed: np.ndarray,
+                       importance: np.ndarray, now_ts: float) -> np.ndarray:
+        """Vectorized classify_and_assign; returns indices into StorageTier."""
+        usage = SDSClassifier.usage_batch(access_count, last_accessed, now_ts)
+        return _TIER_CODES[importance, usage]
 
 # Mock storage backend for retrieval simulation
 class StorageBackend:
@@ -71,24 +139,19 @@ class StorageBackend:
             StorageTier.COLD: 0.200  # 200 ms
         }
         self.max_concurrent_requests = 1000  # System concurrency limit
-        self.current_requests = 0
-        self.lock = asyncio.Lock()
-
-    async def retrieve_artifact(self, artifact_id: str, tier: StorageTier) -> float:
-        """Simulate artifact retrieval with tier-specific latency."""
-        async with self.lock:
-            if self.current_requests >= self.max_concurrent_requests:
-                raise RuntimeError("System overloaded: too many concurrent requests")
-            self.current_requests += 1
-        try:
-            # Simulate latency with random variation (±10%)
+        self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+    async def retrieve_artifact(self, artifact_id: str, tier: StorageTier, jitter: float) -> float:
+        """Simulate artifact retrieval with tier-specific latency scaled by a jitter factor."""
+        # Checking and acquiring without an await in between keeps admission atomic
+        if self.semaphore.locked():
+            raise RuntimeError("System overloaded: too many concurrent requests")
+        async with self.semaphore:
+            # Simulate latency with the caller's random variation (±10%)
             base_latency = self.latencies[tier]
-            latency = base_latency * random.uniform(0.9, 1.1)
+            latency = base_latency * jitter
             await asyncio.sleep(latency)
             return latency
-        finally:
-            async with self.lock:
-                self.current_requests -= 1
 
 # Retrieval performance tester
 class RetrievalPerformanceTester:
@@ -96,61 +159,91 @@ class RetrievalPerformanceTester:
         self.classifier = SDSClassifier()
         self.storage = StorageBackend()
         self.artifacts = artifacts
-        # Assign tiers to artifacts
-        self.artifact_tiers = {a.id: self.classifier.classify_and_assign(a) for a in artifacts}
-
-    async def simulate_retrieval(self, artifact_id: str) -> tuple:
-        """Simulate a single retrieval and return latency."""
-        try:
-            start_time = time.time()
-            tier = self.artifact_tiers[artifact_id]
-            latency = await self.storage.retrieve_artifact(artifact_id, tier)
-            return (artifact_id, latency, None)
-        except Exception as e:
-            return (artifact_id, 0, str(e))
+        self.rng = np.random.default_rng()
+        # Number of worker coroutines pulling retrieval jobs (and bound on queued jobs)
+        self.num_workers = self.storage.max_concurrent_requests
+        # Assign tiers to artifacts in one vectorized pass
+        batch = ArtifactBatch.from_artifacts(artifacts)
+        tier_codes = self.classifier.classify_batch(
+            batch.access_count, batch.last_accessed, batch.importance, time.time())
+        self.artifact_tiers = {a.id: TIERS[code] for a, code in zip(artifacts, tier_codes.tolist())}
+
+    async def simulate_retrieval(self, artifact_id: str, tier: StorageTier, jitter: float) -> tuple:
+        """Simulate a single retrieval from the given tier and return latency."""
+        return (artifact_id, await self.storage.retrieve_artifact(artifact_id, tier, jitter))
+
+    async def retrieval_worker(self, queue: asyncio.Queue, completed: list):
+        """Pull retrieval jobs off the queue and record their results until cancelled."""
+        while True:
+            artifact_id, tier, jitter = await queue.get()
+            try:
+                completed.append((tier, await self.simulate_retrieval(artifact_id, tier, jitter)))
+            except Exception as e:
+                # Failed retrievals are recorded as their exception
+                completed.append((tier, e))
+            finally:
+                queue.task_done()
 
     async def run_test(self, requests_per_second: int, duration_seconds: int) -> Dict:
         """Run retrieval test under specified load."""
         print(f"\nRunning retrieval test: {requests_per_second} requests/sec for {duration_seconds} seconds")
         total_requests = requests_per_second * duration_seconds
         interval = 1 / requests_per_second if requests_per_second > 0 else 1
-        results = []
         errors = 0
-        start_time = time.time()
 
-        # Launch concurrent retrieval tasks
-        for i in range(total_requests):
-            artifact_id = random.choice([a.id for a in self.artifacts])
-            results.append(asyncio.create_task(self.simulate_retrieval(artifact_id)))
-            await asyncio.sleep(interval)
+        # Pick all requested artifacts and resolve their tiers up front
+        ids = [a.id for a in self.artifacts]
+        picks = random.choices(ids, k=total_requests)
+        tiers = [self.artifact_tiers[artifact_id] for artifact_id in picks]
+        # Latency variation (±10%) for every request, drawn in one call
+        jitters = self.rng.uniform(0.9, 1.1, total_requests).tolist()
+
+        # Bounded queue feeding a fixed worker pool provides backpressure
+        queue = asyncio.Queue(maxsize=self.num_workers)
+        completed = []
+        workers = [asyncio.create_task(self.retrieval_worker(queue, completed))
+                   for _ in range(self.num_workers)]
+        start_time = time.monotonic()
 
-        # Collect results
-        completed = await asyncio.gather(*results, return_exceptions=True)
-        elapsed_time = time.time() - start_time
+        # Enqueue each request at its scheduled time
+        for i, job in enumerate(zip(picks, tiers, jitters)):
+            await asyncio.sleep(max(0, start_time + i * interval - time.monotonic()))
+            await queue.put(job)
+
+        # Wait for all jobs to finish, then stop the workers
+        await queue.join()
+        elapsed_time = time.monotonic() - start_time
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
         # Process results
         latencies = []
-        tier_latencies = {tier: [] for tier in StorageTier}
-        for artifact_id, latency, error in completed:
-            if error:
+        latency_tiers = []
+        for tier, result in completed:
+            if isinstance(result, Exception):
                 errors += 1
             else:
-                latencies.append(latency)
-                tier = self.artifact_tiers[artifact_id]
-                tier_latencies[tier].append(latency)
+                latencies.append(result[1])
+                latency_tiers.append(tier)
+        samples = np.fromiter(latencies, dtype=np.float64, count=len(latencies))
+        # Per-tier request counts and latency sums, indexed by tier code
+        latency_tiers = np.asarray(latency_tiers, dtype=np.intp)
+        tier_counts = np.bincount(latency_tiers, minlength=len(StorageTier))
+        tier_sums = np.bincount(latency_tiers, weights=samples, minlength=len(StorageTier))
 
         return {
             "total_requests": total_requests,
             "elapsed_time": elapsed_time,
             "throughput": total_requests / elapsed_time if elapsed_time > 0 else 0,
-            "avg_latency": mean(latencies) if latencies else 0,
-            "latency_std": stdev(latencies) if len(latencies) > 1 else 0,
+            "avg_latency": float(samples.mean()) if samples.size else 0,
+            "latency_std": float(samples.std(ddof=1)) if samples.size > 1 else 0,
             "error_rate": errors / total_requests if total_requests > 0 else 0,
             "tier_latencies": {
                 tier: {
-                    "avg": mean(tl) if tl else 0,
-                    "count": len(tl)
-                } for tier, tl in tier_latencies.items()
+                    "avg": float(tier_sums[tier] / tier_counts[tier]) if tier_counts[tier] else 0,
+                    "count": int(tier_counts[tier])
+                } for tier in StorageTier
             }
         }
 
@@ -166,24 +259,30 @@ class RetrievalPerformanceTester:
         print(f"Error Rate: {results['error_rate']*100:.2f}%")
         print("\nTier-Specific Performance:")
         for tier, stats in results['tier_latencies'].items():
-            print(f"{tier.value}: {stats['count']} requests, Avg Latency: {stats['avg']*1000:.2f} ms")
+            print(f"{tier.label}: {stats['count']} requests, Avg Latency: {stats['avg']*1000:.2f} ms")
 
 # Generate sample artifacts
 def generate_artifacts(num: int) -> List[Artifact]:
-    artifacts = []
+    # Draw every random field for all artifacts up front, one vector op per field
+    rng = np.random.default_rng()
+    type_codes = rng.integers(0, len(ArtifactType), num).tolist()
+    importance_codes = rng.integers(0, len(Importance), num).tolist()
+    access_counts = rng.integers(0, 21, num).tolist()
+    last_accessed = (time.time() - rng.integers(0, 61, num) * 24 * 3600.0).tolist()
     types = list(ArtifactType)
     importances = list(Importance)
-    for i in range(num):
-        artifact_type = random.choice(types)
-        artifacts.append(Artifact(
+    return [
+        Artifact(
             id=f"A{i:04d}",
-            name=f"Artifact_{i}.{artifact_type.value.lower()}",
-            type=artifact_type,
-            access_count=random.randint(0, 20),
-            last_accessed=time.time() - random.randint(0, 60) * 24 * 3600,
-            importance=random.choice(importances)
-        ))
-    return artifacts
+            name=f"Artifact_{i}.{types[type_code].label.lower()}",
+            type=types[type_code],
+            access_count=access_count,
+            last_accessed=accessed,
+            importance=importances[importance_code]
+        )
+        for i, (type_code, access_count, accessed, importance_code)
+        in enumerate(zip(type_codes, access_counts, last_accessed, importance_codes))
+    ]
 
 async def main():
     # Generate 1000 sample artifacts
@@ -202,4 +301,7 @@ async def main():
         tester.analyze_results(results)
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        # libuv-based loop: cheaper task scheduling and sleep wakeups under load
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file